@@ -1,22 +1,101 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, Tuple, List
+from array import array
+from typing import Dict, Iterable, Tuple, List, Optional
 import json
+import math
 
 
 class Graph:
-    """Directed weighted graph using adjacency dict."""
+    """Directed weighted graph using adjacency dict.
+
+    Algorithms work on a compressed sparse row (CSR) copy of the edges with
+    dense integer node IDs. It is built lazily on first use and discarded
+    whenever the graph is mutated.
+    """
 
     def __init__(self) -> None:
         self._adj: Dict[str, Dict[str, float]] = {}
+        self._num_edges = 0
+        # Smallest edge weight, maintained on insert (None = recompute on demand)
+        self._min_weight: Optional[float] = math.inf
+        # Lazily built CSR layout (see _build_csr)
+        self._id_of: Optional[Dict[str, int]] = None
+        self._node_of: Optional[List[str]] = None
+        self._row_ptr: Optional[array] = None
+        self._col_idx: Optional[array] = None
+        self._weights: Optional[array] = None
+        # Lazily built CSR of the reversed graph (see _build_reverse_csr)
+        self._rev_row_ptr: Optional[array] = None
+        self._rev_col_idx: Optional[array] = None
+        self._rev_weights: Optional[array] = None
 
     def add_edge(self, source: str, target: str, weight: float) -> None:
-        if source not in self._adj:
-            self._adj[source] = {}
-        self._adj[source][target] = weight
+        if self._row_ptr is not None:
+            self._invalidate_csr()
+        adj = self._adj
+        targets = adj.get(source)
+        old_weight = None if targets is None else targets.get(target)
+        # Compare before mutating, so an incomparable weight leaves no trace
+        min_weight = self._min_weight
+        if min_weight is not None:
+            if weight < min_weight:
+                min_weight = weight
+            elif old_weight == min_weight and weight > old_weight:
+                # The overwritten edge may have been the only minimum
+                min_weight = None
+        if targets is None:
+            targets = adj[source] = {}
+        targets[target] = weight
+        if old_weight is None:
+            self._num_edges += 1
+        self._min_weight = min_weight
         # Ensure target exists in adjacency map for node iteration
-        if target not in self._adj:
-            self._adj[target] = {}
+        if target not in adj:
+            adj[target] = {}
+
+    def add_edges(self, edges: Iterable[Tuple[str, str, float]]) -> None:
+        """Add many edges in one pass.
+
+        Same result as calling add_edge per edge. The edge count is recounted
+        once at the end, and the counters are written back and the CSR dropped
+        even if the iterable or a weight comparison raises partway through.
+        """
+        adj = self._adj
+        stale = self._min_weight is None
+        min_weight = math.inf if stale else self._min_weight
+        old_num_edges = self._num_edges
+        count = 0
+        try:
+            for count, (source, target, weight) in enumerate(edges, 1):
+                if weight < min_weight:
+                    min_weight = weight
+                targets = adj.get(source)
+                if targets is None:
+                    targets = adj[source] = {}
+                targets[target] = weight
+                # Ensure target exists in adjacency map for node iteration
+                if target not in adj:
+                    adj[target] = {}
+        except BaseException:
+            # The failing edge may not have been stored
+            stale = True
+            raise
+        finally:
+            num_edges = sum(map(len, adj.values()))
+            # Fewer new edges than inserted ones means some were overwritten,
+            # and an overwritten edge may have been the only minimum
+            if stale or num_edges - old_num_edges != count:
+                min_weight = None
+            self._min_weight = min_weight
+            self._num_edges = num_edges
+            self._invalidate_csr()
+
+    def __len__(self) -> int:
+        return len(self._adj)
+
+    def num_edges(self) -> int:
+        return self._num_edges
 
     def neighbors(self, node: str) -> Dict[str, float]:
         return self._adj.get(node, {})
@@ -24,11 +103,100 @@ class Graph:
     def nodes(self) -> Iterable[str]:
         return self._adj.keys()
 
+    def min_weight(self) -> float:
+        """Return the smallest edge weight (``inf`` for a graph without edges)."""
+        if self._min_weight is None:
+            self._min_weight = min(
+                (w for targets in self._adj.values() for w in targets.values()),
+                default=math.inf,
+            )
+        return self._min_weight
+
+    def has_negative_weights(self) -> bool:
+        return self.min_weight() < 0
+
+    def csr(self) -> Tuple[array, array, array]:
+        """Return ``(row_ptr, col_idx, weights)``.
+
+        The outgoing edges of node ``i`` are ``col_idx[k]``/``weights[k]`` for
+        ``k`` in ``range(row_ptr[i], row_ptr[i + 1])``.
+        """
+        if self._row_ptr is None:
+            self._build_csr()
+        return self._row_ptr, self._col_idx, self._weights
+
+    def reverse_csr(self) -> Tuple[array, array, array]:
+        """Return ``(row_ptr, col_idx, weights)`` of incoming edges.
+
+        Uses the same node IDs as :meth:`csr`; ``col_idx`` holds edge sources.
+        """
+        if self._rev_row_ptr is None:
+            self._build_reverse_csr()
+        return self._rev_row_ptr, self._rev_col_idx, self._rev_weights
+
+    def node_index(self) -> Tuple[Dict[str, int], List[str]]:
+        """Return ``(id_of, node_of)`` mapping node names to CSR IDs and back."""
+        if self._row_ptr is None:
+            self._build_csr()
+        return self._id_of, self._node_of
+
+    def _build_csr(self) -> None:
+        node_of = list(self._adj)
+        id_of = {node: i for i, node in enumerate(node_of)}
+        # Edge count is known up front, so the arrays are allocated once.
+        # add_edge/add_edges keep it exact even when an insert fails.
+        row_ptr = array("i", [0]) * (len(node_of) + 1)
+        col_idx = array("i", [0]) * self._num_edges
+        weights = array("d", [0.0]) * self._num_edges
+        k = 0
+        for i, node in enumerate(node_of):
+            for target, weight in self._adj[node].items():
+                col_idx[k] = id_of[target]
+                weights[k] = weight
+                k += 1
+            row_ptr[i + 1] = k
+        self._id_of = id_of
+        self._node_of = node_of
+        self._row_ptr = row_ptr
+        self._col_idx = col_idx
+        self._weights = weights
+
+    def _build_reverse_csr(self) -> None:
+        row_ptr, col_idx, weights = self.csr()
+        n = len(row_ptr) - 1
+        # In-degree counts, then prefix sums give each node's row start
+        starts = [0] * (n + 1)
+        for target in col_idx:
+            starts[target + 1] += 1
+        for i in range(n):
+            starts[i + 1] += starts[i]
+        rev_col_idx = array("i", [0]) * len(col_idx)
+        rev_weights = array("d", [0.0]) * len(weights)
+        slot = starts[:n]
+        for source in range(n):
+            for k in range(row_ptr[source], row_ptr[source + 1]):
+                target = col_idx[k]
+                rev_col_idx[slot[target]] = source
+                rev_weights[slot[target]] = weights[k]
+                slot[target] += 1
+        self._rev_row_ptr = array("i", starts)
+        self._rev_col_idx = rev_col_idx
+        self._rev_weights = rev_weights
+
+    def _invalidate_csr(self) -> None:
+        self._id_of = None
+        self._node_of = None
+        self._row_ptr = None
+        self._col_idx = None
+        self._weights = None
+        self._rev_row_ptr = None
+        self._rev_col_idx = None
+        self._rev_weights = None
+
     @staticmethod
     def from_edge_list(edges: Iterable[Tuple[str, str, float]]) -> "Graph":
         g = Graph()
-        for src, dst, w in edges:
-            g.add_edge(src, dst, w)
+        g.add_edges(edges)
         return g
 
     @classmethod
@@ -43,7 +211,7 @@ class Graph:
         """
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
-        edges: List[Tuple[str, str, float]] = [
-            (e["source"], e["target"], e["weight"]) for e in data["edges"]
-        ]
-        return cls.from_edge_list(edges)
+        g = cls()
+        # Insert straight from the parsed records; no intermediate edge list
+        g.add_edges((e["source"], e["target"], e["weight"]) for e in data["edges"])
+        return g
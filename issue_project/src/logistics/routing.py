@@ -1,58 +1,282 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple, Optional
+from collections import deque
+from typing import Dict, List, Tuple, Optional, Sequence
 import heapq
 
 from .graph import Graph
 
 
+def shortest_path(graph: Graph, start: str, goal: str) -> Tuple[List[str], float]:
+    """
+    Compute shortest path from start to goal, picking the algorithm by weights.
+
+    Bidirectional Dijkstra is used when every edge weight is non-negative;
+    otherwise Bellman-Ford, which also rejects negative cycles.
+    """
+    if graph.has_negative_weights():
+        return bellman_ford_shortest_path(graph, start, goal)
+    return bidirectional_dijkstra_shortest_path(graph, start, goal)
+
+
 def dijkstra_shortest_path(graph: Graph, start: str, goal: str) -> Tuple[List[str], float]:
     """
-    Compute shortest path from start to goal using a naive Dijkstra implementation.
+    Compute shortest path from start to goal using Dijkstra's algorithm.
 
-    NOTE: This implementation intentionally omits negative-edge validation and
-    aggressively marks nodes as visited upon discovery (not upon finalization).
-    That means it can produce incorrect results on graphs with negative weights.
+    NOTE: This implementation still omits negative-edge validation, so it can
+    produce incorrect results on graphs with negative weights.
     """
-    # Distances and predecessor tracking
-    dist: Dict[str, float] = {start: 0.0}
-    prev: Dict[str, Optional[str]] = {start: None}
+    row_ptr, col_idx, weights = graph.csr()
+    id_of, node_of = graph.node_index()
+    source = id_of.get(start)
+    target = id_of.get(goal)
+    if source is None or target is None:
+        raise ValueError(f"No path found from {start} to {goal}")
+    # Trivial query: skip allocating per-node search state
+    if source == target:
+        return [start], 0.0
+
+    dist, prev = _dijkstra_csr(row_ptr, col_idx, weights, source, target)
+    if dist[target] == float("inf"):
+        raise ValueError(f"No path found from {start} to {goal}")
+    return _reconstruct_path(prev, node_of, target), dist[target]
 
-    # Min-heap items: (cost, node)
-    heap: List[Tuple[float, str]] = [(0.0, start)]
 
-    # BUG: mark nodes visited immediately when they are discovered rather than when popped.
-    visited = set([start])
+def _dijkstra_csr(
+    row_ptr: Sequence[int],
+    col_idx: Sequence[int],
+    weights: Sequence[float],
+    start: int,
+    goal: int,
+) -> Tuple[List[float], Dict[int, Optional[int]]]:
+    """Dijkstra relaxation loop over CSR arrays, stopping once goal is settled."""
+    # Distances and predecessor tracking, indexed by CSR node ID
+    dist = [float("inf")] * (len(row_ptr) - 1)
+    dist[start] = 0.0
+    prev: Dict[int, Optional[int]] = {start: None}
+
+    # Min-heap items: (cost, node_id)
+    heap: List[Tuple[float, int]] = [(0.0, start)]
+    # Local bindings keep attribute lookups out of the hot loop
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    # Nodes are finalized when popped, never when first discovered.
+    # One flag byte per node ID instead of a hashed set.
+    visited = bytearray(len(row_ptr) - 1)
 
     while heap:
-        cost, node = heapq.heappop(heap)
+        cost, node = heappop(heap)
+
+        # Skip stale entries for nodes that were already finalized
+        if visited[node]:
+            continue
+        visited[node] = 1
 
         if node == goal:
-            return _reconstruct_path(prev, goal), cost
+            break
+
+        for k in range(row_ptr[node], row_ptr[node + 1]):
+            neighbor = col_idx[k]
+            # Invariant: finalized nodes are never relaxed again, and a node
+            # is only pushed when its tentative distance strictly improves,
+            # so equal-cost relaxations never add stale heap entries.
+            if visited[neighbor]:
+                continue
+            new_cost = cost + weights[k]
+            if new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                prev[neighbor] = node
+                heappush(heap, (new_cost, neighbor))
+
+    return dist, prev
+
+
+def bidirectional_dijkstra_shortest_path(graph: Graph, start: str, goal: str) -> Tuple[List[str], float]:
+    """
+    Compute shortest path from start to goal searching from both ends.
+
+    Runs Dijkstra forward from start and backward from goal (over incoming
+    edges) until the two frontiers cannot improve on the best meeting point.
+    Requires non-negative edge weights.
+    """
+    row_ptr, col_idx, weights = graph.csr()
+    rev_row_ptr, rev_col_idx, rev_weights = graph.reverse_csr()
+    id_of, node_of = graph.node_index()
+    source = id_of.get(start)
+    target = id_of.get(goal)
+    if source is None or target is None:
+        raise ValueError(f"No path found from {start} to {goal}")
+    if source == target:
+        return [start], 0.0
+
+    inf = float("inf")
+    dist_fwd = [inf] * len(node_of)
+    dist_bwd = [inf] * len(node_of)
+    dist_fwd[source] = 0.0
+    dist_bwd[target] = 0.0
+    # prev_fwd points back toward start, prev_bwd points on toward goal
+    prev_fwd: Dict[int, Optional[int]] = {source: None}
+    prev_bwd: Dict[int, Optional[int]] = {target: None}
+    heap_fwd: List[Tuple[float, int]] = [(0.0, source)]
+    heap_bwd: List[Tuple[float, int]] = [(0.0, target)]
+    # Settled flags per node ID for each direction
+    done_fwd = bytearray(len(row_ptr) - 1)
+    done_bwd = bytearray(len(row_ptr) - 1)
+    best = inf
+    meet: Optional[int] = None
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    while heap_fwd and heap_bwd:
+        # No unsettled pair of frontier nodes can beat the best meeting point
+        if heap_fwd[0][0] + heap_bwd[0][0] >= best:
+            break
+        # Expand the side whose frontier is closer to its origin
+        if heap_fwd[0][0] <= heap_bwd[0][0]:
+            heap, done, dist, prev, other = heap_fwd, done_fwd, dist_fwd, prev_fwd, dist_bwd
+            ptr, idx, wts = row_ptr, col_idx, weights
+        else:
+            heap, done, dist, prev, other = heap_bwd, done_bwd, dist_bwd, prev_bwd, dist_fwd
+            ptr, idx, wts = rev_row_ptr, rev_col_idx, rev_weights
 
-        # If a stale entry is popped, skip it
-        if cost > dist.get(node, float("inf")):
+        cost, node = heappop(heap)
+        if done[node]:
             continue
+        done[node] = 1
 
-        for neighbor, weight in graph.neighbors(node).items():
-            # BUG: No check for negative weights
-            new_cost = cost + weight
-            if neighbor in visited:
-                # BUG: Because neighbor is marked visited early, we never relax it again
+        for k in range(ptr[node], ptr[node + 1]):
+            neighbor = idx[k]
+            if done[neighbor]:
                 continue
-            if new_cost < dist.get(neighbor, float("inf")):
+            new_cost = cost + wts[k]
+            if new_cost < dist[neighbor]:
                 dist[neighbor] = new_cost
                 prev[neighbor] = node
-                heapq.heappush(heap, (new_cost, neighbor))
-                visited.add(neighbor)  # BUG: premature finalization
+                heappush(heap, (new_cost, neighbor))
+                # inf on the other side never beats best
+                if new_cost + other[neighbor] < best:
+                    best = new_cost + other[neighbor]
+                    meet = neighbor
 
-    raise ValueError(f"No path found from {start} to {goal}")
+    if meet is None:
+        raise ValueError(f"No path found from {start} to {goal}")
+
+    path = _reconstruct_path(prev_fwd, node_of, meet)
+    node = prev_bwd[meet]
+    while node is not None:
+        path.append(node_of[node])
+        node = prev_bwd[node]
+    return path, best
+
+
+def bellman_ford_shortest_path(graph: Graph, start: str, goal: str) -> Tuple[List[str], float]:
+    """
+    Compute shortest path from start to goal using Bellman-Ford.
+
+    Unlike Dijkstra this handles negative edge weights. Raises ValueError if a
+    negative cycle is reachable from start.
+    """
+    row_ptr, col_idx, weights = graph.csr()
+    id_of, node_of = graph.node_index()
+    source = id_of.get(start)
+    target = id_of.get(goal)
+    if source is None or target is None:
+        raise ValueError(f"No path found from {start} to {goal}")
+
+    dist, prev, cycle = _bellman_ford_csr(row_ptr, col_idx, weights, source)
+    if cycle is not None:
+        names = [node_of[node] for node in cycle]
+        raise ValueError(f"Negative cycle detected: {' -> '.join(names + names[:1])}")
+    if dist[target] == float("inf"):
+        raise ValueError(f"No path found from {start} to {goal}")
+    return _reconstruct_path(prev, node_of, target), dist[target]
+
+
+def _bellman_ford_csr(
+    row_ptr: Sequence[int],
+    col_idx: Sequence[int],
+    weights: Sequence[float],
+    start: int,
+) -> Tuple[List[float], Dict[int, Optional[int]], Optional[List[int]]]:
+    """Queue-based Bellman-Ford (SPFA) over CSR arrays.
+
+    Only nodes whose distance just improved are rescanned. Returns
+    ``(dist, prev, cycle)`` where ``cycle`` lists the node IDs of a negative
+    cycle reachable from start, or is None if there is none.
+    """
+    n = len(row_ptr) - 1
+    dist = [float("inf")] * n
+    dist[start] = 0.0
+    prev: Dict[int, Optional[int]] = {start: None}
+
+    # Edge count of the walk behind each tentative distance; reaching n means
+    # the walk repeats a node, which only a negative cycle can cause.
+    length = [0] * n
+    # The predecessor graph is also searched for a cycle once every n
+    # relaxations: O(1) amortized, and it usually catches a negative cycle
+    # long before any walk grows to n edges.
+    budget = n
+    in_queue = [False] * n
+    queue = deque([start])
+    in_queue[start] = True
+    # Local bindings keep attribute lookups out of the hot loop
+    dequeue = queue.popleft
+    enqueue = queue.append
+
+    while queue:
+        node = dequeue()
+        in_queue[node] = False
+        cost = dist[node]
+        for k in range(row_ptr[node], row_ptr[node + 1]):
+            neighbor = col_idx[k]
+            new_cost = cost + weights[k]
+            if new_cost < dist[neighbor]:
+                dist[neighbor] = new_cost
+                prev[neighbor] = node
+                length[neighbor] = length[node] + 1
+                budget -= 1
+                if budget == 0 or length[neighbor] >= n:
+                    budget = n
+                    cycle = _predecessor_cycle(prev, n)
+                    if cycle is not None:
+                        return dist, prev, cycle
+                if not in_queue[neighbor]:
+                    in_queue[neighbor] = True
+                    enqueue(neighbor)
+
+    return dist, prev, None
+
+
+def _predecessor_cycle(prev: Dict[int, Optional[int]], n: int) -> Optional[List[int]]:
+    """Return a cycle in the predecessor graph, or None if it is a tree.
+
+    Every cycle in the predecessor graph is a negative cycle. Each node is
+    walked at most once, so the search is O(V).
+    """
+    # 0 = unseen, 1 = on the current walk, 2 = known to lead to the root
+    state = bytearray(n)
+    for root in prev:
+        walk: List[int] = []
+        node: Optional[int] = root
+        while node is not None and not state[node]:
+            state[node] = 1
+            walk.append(node)
+            node = prev.get(node)
+        if node is not None and state[node] == 1:
+            cycle = walk[walk.index(node):]
+            cycle.reverse()
+            return cycle
+        for visited in walk:
+            state[visited] = 2
+    return None
 
 
-def _reconstruct_path(prev: Dict[str, Optional[str]], goal: str) -> List[str]:
+def _reconstruct_path(prev: Dict[int, Optional[int]], node_of: List[str], goal: int) -> List[str]:
     path: List[str] = []
-    node = goal
+    node: Optional[int] = goal
     while node is not None:
-        path.append(node)
+        path.append(node_of[node])
         node = prev.get(node)
-    return list(reversed(path))
+    path.reverse()
+    return path
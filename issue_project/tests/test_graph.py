@@ -0,0 +1,73 @@
+import pytest
+
+from logistics.graph import Graph
+from logistics.routing import dijkstra_shortest_path, shortest_path
+
+
+def _records(records):
+    return ((r["source"], r["target"], r["weight"]) for r in records)
+
+
+@pytest.mark.parametrize(
+    "edges, error",
+    [
+        # A malformed record makes the generator raise after B -> C went in
+        (_records([{"source": "B", "target": "C", "weight": -1}, {"source": "C"}]), KeyError),
+        # An incomparable weight fails before its edge is stored
+        ([("B", "C", -1), ("C", "D", "heavy")], TypeError),
+    ],
+    ids=["generator-raises", "incomparable-weight"],
+)
+def test_failed_add_edges_leaves_built_graph_consistent(edges, error):
+    graph = Graph.from_edge_list([("A", "B", 2)])
+    assert shortest_path(graph, "A", "B") == (["A", "B"], 2.0)
+
+    with pytest.raises(error):
+        graph.add_edges(edges)
+
+    assert graph.num_edges() == 2
+    assert graph.has_negative_weights()
+    row_ptr, col_idx, weights = graph.csr()
+    assert len(col_idx) == len(weights) == row_ptr[-1] == 2
+    assert shortest_path(graph, "A", "C") == (["A", "B", "C"], 1.0)
+    with pytest.raises(ValueError):
+        shortest_path(graph, "A", "D")
+
+
+def test_failed_add_edge_leaves_graph_unchanged():
+    graph = Graph.from_edge_list([("A", "B", 2)])
+    graph.csr()
+
+    with pytest.raises(TypeError):
+        graph.add_edge("B", "C", "heavy")
+
+    assert graph.num_edges() == 1
+    assert graph.min_weight() == 2
+    assert len(graph.csr()[1]) == 1
+
+
+def test_num_edges_counts_overwritten_edges_once():
+    graph = Graph.from_edge_list([("A", "B", 1), ("A", "B", 2), ("B", "C", 1)])
+    assert graph.num_edges() == 2
+
+    graph.add_edge("A", "B", 3)
+    graph.add_edges([("B", "C", 4), ("C", "A", 1)])
+    assert graph.num_edges() == 3
+    row_ptr, col_idx, weights = graph.csr()
+    assert len(col_idx) == len(weights) == row_ptr[-1] == 3
+
+
+def test_non_string_node_ids_are_supported():
+    graph = Graph.from_edge_list([(1, 2, 3), (2, 3, 1)])
+    assert graph.node_index()[1] == [1, 2, 3]
+    assert dijkstra_shortest_path(graph, 1, 2) == ([1, 2], 3.0)
+    assert shortest_path(graph, 1, 3) == ([1, 2, 3], 4.0)
+
+
+def test_len_counts_sources_and_targets():
+    assert len(Graph()) == 0
+    graph = Graph.from_edge_list([("A", "B", 1), ("A", "B", 2), ("C", "A", 1)])
+    # Target-only nodes count; repeated edges add no nodes
+    assert len(graph) == 3
+    graph.add_edge("D", "D", 0)
+    assert len(graph) == 4
@@ -0,0 +1,20 @@
+import pytest
+
+from logistics.graph import Graph
+from logistics.routing import (
+    bellman_ford_shortest_path,
+    bidirectional_dijkstra_shortest_path,
+    dijkstra_shortest_path,
+    shortest_path,
+)
+
+ROUTERS = [dijkstra_shortest_path, bidirectional_dijkstra_shortest_path, bellman_ford_shortest_path, shortest_path]
+
+
+@pytest.mark.parametrize("route", ROUTERS)
+def test_unknown_node_has_no_path_even_to_itself(route):
+    """Nodes absent from the graph are rejected, including trivial start == goal queries."""
+    graph = Graph.from_edge_list([("A", "B", 1)])
+    with pytest.raises(ValueError, match="No path found from Z to Z"):
+        route(graph, "Z", "Z")
+    assert route(graph, "A", "A") == (["A"], 0.0)
@@ -0,0 +1,29 @@
+import pytest
+
+from logistics.graph import Graph
+from logistics.routing import bidirectional_dijkstra_shortest_path, dijkstra_shortest_path
+
+EDGES = [
+    ("A", "B", 4), ("A", "C", 1), ("C", "B", 2), ("B", "D", 1),
+    ("C", "D", 5), ("D", "E", 3), ("E", "F", 1), ("C", "F", 9),
+    ("X", "Y", 1),
+]
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return Graph.from_edge_list(EDGES)
+
+
+@pytest.mark.parametrize("start,goal", [("A", "B"), ("A", "D"), ("A", "F"), ("C", "E"), ("X", "Y")])
+def test_bidirectional_matches_dijkstra(graph, start, goal):
+    expected = dijkstra_shortest_path(graph, start, goal)
+    assert bidirectional_dijkstra_shortest_path(graph, start, goal) == expected
+
+
+def test_bidirectional_follows_edge_direction(graph):
+    with pytest.raises(ValueError, match="No path"):
+        bidirectional_dijkstra_shortest_path(graph, "F", "A")
+    with pytest.raises(ValueError, match="No path"):
+        bidirectional_dijkstra_shortest_path(graph, "A", "Y")
+
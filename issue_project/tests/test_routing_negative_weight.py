@@ -2,12 +2,12 @@ import pytest
 from pathlib import Path
 
 from logistics.graph import Graph
-from logistics.routing import dijkstra_shortest_path
+from logistics.routing import bellman_ford_shortest_path, dijkstra_shortest_path, shortest_path
 
 FIXTURE_PATH = Path(__file__).resolve().parents[1] / "data" / "graph_negative_weight.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def graph():
     return Graph.from_json_file(str(FIXTURE_PATH))
 
@@ -23,3 +23,42 @@ def test_dijkstra_finds_optimal_path_despite_negative_edge(graph):
     path, cost = dijkstra_shortest_path(graph, "A", "B")
     assert path == ["A", "C", "D", "F", "B"]
     assert cost == pytest.approx(1.0)
+
+
+def test_bellman_ford_finds_optimal_path(graph):
+    """Bellman-Ford supports negative edges and finds the optimal path (cost=1)."""
+    path, cost = bellman_ford_shortest_path(graph, "A", "B")
+    assert path == ["A", "C", "D", "F", "B"]
+    assert cost == pytest.approx(1.0)
+
+
+def test_bellman_ford_reports_negative_cycle():
+    """A reachable negative cycle is rejected and named in the error."""
+    graph = Graph.from_edge_list([("A", "B", 1), ("B", "C", -3), ("C", "B", 1), ("C", "D", 1)])
+    with pytest.raises(ValueError, match="Negative cycle detected: (B -> C -> B|C -> B -> C)"):
+        bellman_ford_shortest_path(graph, "A", "D")
+
+
+def test_shortest_path_selects_bellman_ford_for_negative_weights():
+    """The dispatcher detects the negative edge and routes via Bellman-Ford.
+
+    Dijkstra settles B at cost 1 before seeing C->B (-3), so it returns
+    A->B->D (2); only Bellman-Ford finds A->C->B->D (1).
+    """
+    graph = Graph.from_edge_list([("A", "B", 1), ("A", "C", 3), ("C", "B", -3), ("B", "D", 1)])
+    assert graph.has_negative_weights()
+    path, cost = shortest_path(graph, "A", "D")
+    assert path == ["A", "C", "B", "D"]
+    assert cost == pytest.approx(1.0)
+
+
+def test_overwriting_only_negative_edge_clears_negative_flag():
+    """Replacing the minimum edge with a larger weight forces a recompute."""
+    graph = Graph.from_edge_list([("A", "B", -2), ("B", "C", 1)])
+    assert graph.has_negative_weights()
+    graph.add_edge("A", "B", 4)
+    assert not graph.has_negative_weights()
+    assert graph.min_weight() == 1
+    path, cost = shortest_path(graph, "A", "C")
+    assert path == ["A", "B", "C"]
+    assert cost == pytest.approx(5.0)